@@ -40,8 +40,8 @@ of loops that iterate over dofs and contain the setval_c builtin.
 '''
 from psyclone.transformations import Dynamo0p3RedundantComputationTrans
 
-ITERATION_SPACES = ["dofs"]
-KERNEL_NAMES = ["setval_c"]
+ITERATION_SPACES = frozenset(["dofs"])
+KERNEL_NAMES = frozenset(["setval_c"])
 DEPTH = 1
 
 
@@ -60,19 +60,17 @@ def trans(psyir):
     '''
     rc_trans = Dynamo0p3RedundantComputationTrans()
 
-    transformed = 0
+    # Select the loops first, so that the tree is not modified while it
+    # is being searched. We may have more than one kernel in a loop, so
+    # check that all of them are in the set of accepted kernel names.
+    loops = [loop for loop in psyir.loops()
+             if loop.iteration_space in ITERATION_SPACES and
+             all(call.name in KERNEL_NAMES for call in loop.kernels())]
 
-    for loop in psyir.loops():
-        if loop.iteration_space in ITERATION_SPACES:
-            # we may have more than one kernel in the loop so
-            # check that all of them are in the list of accepted
-            # kernel names
-            for call in loop.kernels():
-                if call.name not in KERNEL_NAMES:
-                    break
-            else:
-                # All kernels are valid
-                transformed += 1
-                rc_trans.apply(loop, {"depth": DEPTH})
+    # The options are not modified by the transformation, so the same
+    # dictionary can be used for every loop.
+    options = {"depth": DEPTH}
+    for loop in loops:
+        rc_trans.apply(loop, options)
 
-    print(f"Transformed {transformed} loops")
+    print(f"Transformed {len(loops)} loops")
@@ -63,6 +63,10 @@ class Signature:
     :type sub_sig: :py:class:`psyclone.core.Signature`
 
     '''
+    # Signatures are created in large numbers (e.g. for every variable
+    # access), so avoid a per-instance dictionary.
+    __slots__ = ("_signature",)
+
     def __init__(self, variable, sub_sig=None):
         if sub_sig:
             sub_tuple = sub_sig._signature
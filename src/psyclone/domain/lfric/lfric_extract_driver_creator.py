@@ -163,22 +163,19 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
        example, a variable ``f`` which was modified in the kernel call(s),
        will then be compared with ``f_post``.
 
-    :param precision: a mapping of the various precisions used in LFRic to
-        the actual Fortran data type to be used in a stand-alone driver.
-    :type precision: Optional[Dict[str, str]]
-
-    :raises InternalError: if the precision argument is specified but
-        is not a dictionary.
+    The precision symbols used in the driver are imported from the LFRic
+    constants module, using the precisions listed in the ``precision_map``
+    of the LFRic section of the config file.
 
     '''
-    def __init__(self):
-        super().__init__()
-        # TODO #2069: check if this list can be taken from LFRicConstants
-        # TODO #2018: once r_field is defined in the LFRic infrastructure,
-        #             it should be added to this list.
-        self._all_field_types = ["integer_field_type", "field_type",
-                                 "r_bl_field", "r_solver_field_type",
-                                 "r_tran_field_type"]
+    # The names of all LFRic field types. This is only used for membership
+    # tests, so it is shared by all instances as a frozenset.
+    # TODO #2069: check if this list can be taken from LFRicConstants
+    # TODO #2018: once r_field is defined in the LFRic infrastructure,
+    #             it should be added to this list.
+    _ALL_FIELD_TYPES = frozenset(["integer_field_type", "field_type",
+                                  "r_bl_field", "r_solver_field_type",
+                                  "r_tran_field_type"])
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -217,7 +214,7 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
         proxy_name_mapping = {}
         for kern in schedule.walk(Kern):
             for arg in kern.args:
-                if arg.data_type in self._all_field_types:
+                if arg.data_type in self._ALL_FIELD_TYPES:
                     proxy_name_mapping[arg.proxy_name] = arg.name
         return proxy_name_mapping
 
@@ -578,7 +575,7 @@ class LFRicExtractDriverCreator(BaseDriverCreator):
                 intrinsic_name = sym.datatype.partial_datatype.intrinsic.name
             else:
                 intrinsic_name = sym.datatype.intrinsic.name
-            return intrinsic_name in self._all_field_types
+            return intrinsic_name in self._ALL_FIELD_TYPES
 
         symbol_table = program.scope.symbol_table
         read_var = f"{psy_data.name}%ReadVariable"
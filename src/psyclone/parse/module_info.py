@@ -48,7 +48,7 @@ from fparser.two import Fortran2003
 from fparser.two.utils import walk
 
 from psyclone.errors import InternalError, PSycloneError, GenerationError
-from psyclone.psyir.nodes import Container
+from psyclone.psyir.nodes import Container, Routine
 from psyclone.psyir.symbols import Symbol
 from psyclone.parse import FileInfo, FileInfoFParserError
 
@@ -272,8 +272,11 @@ class ModuleInfo:
                       f"'{err}'")
                 return None
 
-        # Return the Container with the correct name.
-        for container_node in self._psyir_container_node.walk(Container):
+        # Return the Container with the correct name. Containers can only
+        # be nested inside other Containers, so there is no need to search
+        # the bodies of any Routines.
+        for container_node in self._psyir_container_node.walk(
+                Container, stop_type=Routine):
             if container_node.name.lower() == self.name:
                 return container_node
 
@@ -40,9 +40,12 @@ for different language-specific visitors.
 '''
 
 import abc
+from typing import List, Optional, Tuple
 
 from psyclone.psyir.backend.visitor import PSyIRVisitor, VisitorError
-from psyclone.psyir.nodes import Member
+from psyclone.psyir.nodes import (
+    ArrayOfStructuresReference, ArrayReference, Clause, Member, Node,
+    StructureReference)
 
 
 class LanguageWriter(PSyIRVisitor):
@@ -63,7 +66,8 @@ class LanguageWriter(PSyIRVisitor):
 
     '''
     # pylint: disable=too-many-arguments
-    def __init__(self, array_parenthesis, structure_character, **kwargs):
+    def __init__(self, array_parenthesis: Tuple[str, str],
+                 structure_character: str, **kwargs):
 
         super().__init__(**kwargs)
         if not isinstance(array_parenthesis, tuple) or \
@@ -73,14 +77,17 @@ class LanguageWriter(PSyIRVisitor):
                             f"'{array_parenthesis}'.")
         if not isinstance(structure_character, str):
             raise TypeError(f"Invalid structure_character parameter, must be "
-                            f"a string, got '{array_parenthesis}'.")
+                            f"a string, got '{structure_character}'.")
 
         self._array_parenthesis = array_parenthesis
+        # Keep the opening and closing parenthesis separately, so the
+        # frequently called visitors below do not need to index the tuple.
+        self._open_paren, self._close_paren = array_parenthesis
         self._structure_character = structure_character
 
     # ------------------------------------------------------------------------
     @property
-    def array_parenthesis(self):
+    def array_parenthesis(self) -> Tuple[str, str]:
         ''':returns: the array parenthesis to be used in this language.
         :rtype: two element list of str
         '''
@@ -89,7 +96,7 @@ class LanguageWriter(PSyIRVisitor):
 
     # ------------------------------------------------------------------------
     @property
-    def structure_character(self):
+    def structure_character(self) -> str:
         ''':returns: the character use to access a member of a structure in \
             this language.
         :rtype: str
@@ -98,7 +105,8 @@ class LanguageWriter(PSyIRVisitor):
 
     # ------------------------------------------------------------------------
     @abc.abstractmethod
-    def gen_indices(self, indices, var_name=None):
+    def gen_indices(self, indices: List[Node],
+                    var_name: Optional[str] = None) -> List[str]:
         '''Given a list of PSyIR nodes representing the dimensions of an
         array, return a list of strings representing those array dimensions.
 
@@ -113,7 +121,24 @@ class LanguageWriter(PSyIRVisitor):
         '''
 
     # ------------------------------------------------------------------------
-    def arrayreference_node(self, node):
+    def gen_indices_str(self, indices: List[Node],
+                        var_name: Optional[str] = None) -> str:
+        '''Given a list of PSyIR nodes representing the dimensions of an
+        array, return the comma-separated string of those array dimensions
+        (without the enclosing parenthesis).
+
+        :param indices: list of PSyIR nodes.
+        :param var_name: name of the variable for which the dimensions
+            are created. Only used in the C implementation.
+
+        :returns: the code representation of the dimensions.
+        :rtype: str
+
+        '''
+        return ",".join(self.gen_indices(indices, var_name))
+
+    # ------------------------------------------------------------------------
+    def arrayreference_node(self, node: ArrayReference) -> str:
         '''This method is called when an ArrayReference instance is found
         in the PSyIR tree.
 
@@ -126,17 +151,17 @@ class LanguageWriter(PSyIRVisitor):
         :raises VisitorError: if the node does not have any children.
 
         '''
-        if not node.children:
+        name = node.name
+        children = node.children
+        if not children:
             raise VisitorError(
-                f"Incomplete ArrayReference node (for symbol '{node.name}') "
+                f"Incomplete ArrayReference node (for symbol '{name}') "
                 f"found: must have one or more children.")
-        args = self.gen_indices(node.children, node.name)
-        result = f"{node.name}{self._array_parenthesis[0]}"\
-                 f"{','.join(args)}{self._array_parenthesis[1]}"
-        return result
+        args = self.gen_indices_str(children, name)
+        return f"{name}{self._open_paren}{args}{self._close_paren}"
 
     # ------------------------------------------------------------------------
-    def structurereference_node(self, node):
+    def structurereference_node(self, node: StructureReference) -> str:
         '''
         Creates the code for an access to a member of a structure type.
 
@@ -150,22 +175,24 @@ class LanguageWriter(PSyIRVisitor):
                               as its only child.
 
         '''
-        if len(node.children) != 1:
+        children = node.children
+        num_children = len(children)
+        if num_children != 1:
             raise VisitorError(
                 f"A StructureReference must have a single child but the "
-                f"reference to symbol '{node.name}' has {len(node.children)}.")
-        if not isinstance(node.children[0], Member):
+                f"reference to symbol '{node.name}' has {num_children}.")
+        if not isinstance(children[0], Member):
             raise VisitorError(
                 f"A StructureReference must have a single child which is a "
                 f"sub-class of Member but the reference to symbol "
                 f"'{node.name}' has a child of type "
-                f"'{type(node.children[0]).__name__}'")
+                f"'{type(children[0]).__name__}'")
         result = node.symbol.name + self._structure_character + \
-            self._visit(node.children[0])
+            self._visit(children[0])
         return result
 
     # ------------------------------------------------------------------------
-    def member_node(self, node):
+    def member_node(self, node: Member) -> str:
         '''
         Creates the code for an access to a member of a derived type.
 
@@ -176,35 +203,34 @@ class LanguageWriter(PSyIRVisitor):
         :rtype: str
 
         '''
-        result = node.name
-        if not node.children:
+        name = node.name
+        children = node.children
+        if not children:
             # A simple member access that does not access any further
             # structures, so just return the name itself
-            return result
-
-        if isinstance(node.children[0], Member):
-            # If the first child is a member, we are accessing a structure:
-            if len(node.children) > 1:
-                # If the node has more children, any additional children are
-                # array indices. Add the indices to the output string:
-                indices = self.gen_indices(node.children[1:], node.name)
-                result += f"{self._array_parenthesis[0]}{','.join(indices)}"\
-                          f"{self._array_parenthesis[1]}"
+            return name
+
+        if isinstance(children[0], Member):
+            # If the first child is a member, we are accessing a structure.
+            # Any additional children are array indices:
+            if len(children) > 1:
+                indices = self.gen_indices_str(children[1:], name)
+                name = f"{name}{self._open_paren}{indices}{self._close_paren}"
             # Now add the first child, which is the member that is being
             # accessed, to the output string
-            result += self._structure_character + self._visit(node.children[0])
-        else:
-            # There is no access of a structure element, add the children
-            # (which exist since this was tested above) as indices to the
-            # output string.
-            args = self.gen_indices(node.children, node.name)
-            result += f"{self._array_parenthesis[0]}{','.join(args)}"\
-                      f"{self._array_parenthesis[1]}"
-        return result
+            return (f"{name}{self._structure_character}"
+                    f"{self._visit(children[0])}")
+
+        # There is no access of a structure element, add the children
+        # (which exist since this was tested above) as indices to the
+        # output string.
+        args = self.gen_indices_str(children, name)
+        return f"{name}{self._open_paren}{args}{self._close_paren}"
 
     # ------------------------------------------------------------------------
 
-    def arrayofstructuresreference_node(self, node):
+    def arrayofstructuresreference_node(
+            self, node: ArrayOfStructuresReference) -> str:
         '''
         Creates the code for a reference to one or more elements of an
         array of derived types.
@@ -218,27 +244,28 @@ class LanguageWriter(PSyIRVisitor):
         :raises VisitorError: if the supplied node does not have the correct \
                               number and type of children.
         '''
-        if len(node.children) < 2:
+        children = node.children
+        num_children = len(children)
+        if num_children < 2:
             raise VisitorError(
                 f"An ArrayOfStructuresReference must have at least two "
-                f"children but found {len(node.children)}")
+                f"children but found {num_children}")
 
-        if not isinstance(node.children[0], Member):
+        if not isinstance(children[0], Member):
             raise VisitorError(
                 f"An ArrayOfStructuresReference must have a Member as its "
-                f"first child but found '{type(node.children[0]).__name__}'")
+                f"first child but found '{type(children[0]).__name__}'")
 
         # Generate the array reference. We need to skip over the first child
         # (as that refers to the member of the derived type being accessed).
-        args = self.gen_indices(node.children[1:])
+        args = self.gen_indices_str(children[1:])
 
-        result = (node.symbol.name + self._array_parenthesis[0] +
-                  ",".join(args) + self._array_parenthesis[1] +
-                  self._structure_character + self._visit(node.children[0]))
-        return result
+        return (f"{node.symbol.name}{self._open_paren}{args}"
+                f"{self._close_paren}{self._structure_character}"
+                f"{self._visit(children[0])}")
 
     # ------------------------------------------------------------------------
-    def clause_node(self, node):
+    def clause_node(self, node: Clause) -> str:
         '''This method is called when a Clause instance is found in the
         PSyIR tree. It returns the clause and its children as a string.
 
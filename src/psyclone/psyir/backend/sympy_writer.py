@@ -48,7 +48,8 @@ from psyclone.psyir.backend.visitor import VisitorError
 from psyclone.psyir.frontend.sympy_reader import SymPyReader
 from psyclone.psyir.nodes import (
     DataNode, Range, Reference, IntrinsicCall, Call)
-from psyclone.psyir.symbols import (ArrayType, ScalarType, SymbolTable)
+from psyclone.psyir.symbols import (ArrayType, ScalarType, Symbol,
+                                    SymbolTable)
 
 
 class SymPyWriter(FortranWriter):
@@ -98,6 +99,19 @@ class SymPyWriter(FortranWriter):
     # This class attribute will get initialised in __init__:
     _RESERVED_NAMES = set()
 
+    # The mapping of intrinsic Fortran operations that need a rename or
+    # are case sensitive in SymPy to the name SymPy expects.
+    _INTRINSIC_TO_STR = {IntrinsicCall.Intrinsic.MAX: "Max",
+                         IntrinsicCall.Intrinsic.MIN: "Min",
+                         IntrinsicCall.Intrinsic.FLOOR: "floor",
+                         IntrinsicCall.Intrinsic.TRANSPOSE: "transpose",
+                         IntrinsicCall.Intrinsic.MOD: "Mod",
+                         # exp is needed for a test case only, in general
+                         # the maths functions can just be handled as
+                         # unknown sympy functions.
+                         IntrinsicCall.Intrinsic.EXP: "exp",
+                         }
+
     def __init__(self):
         super().__init__()
 
@@ -130,26 +144,6 @@ class SymPyWriter(FortranWriter):
         # (SymPy symbols) or arrays (SymPy functions).
         self._sympy_type_map = {}
 
-        # The set of intrinsic Fortran operations that need a rename or
-        # are case sensitive in SymPy:
-        self._intrinsic = set()
-        self._intrinsic_to_str = {}
-
-        # Create the mapping of intrinsics to the name SymPy expects.
-        for intr, intr_str in [(IntrinsicCall.Intrinsic.MAX, "Max"),
-                               (IntrinsicCall.Intrinsic.MIN, "Min"),
-                               (IntrinsicCall.Intrinsic.FLOOR, "floor"),
-                               (IntrinsicCall.Intrinsic.TRANSPOSE,
-                                "transpose"),
-                               (IntrinsicCall.Intrinsic.MOD, "Mod"),
-                               # exp is needed for a test case only, in
-                               # general the maths functions can just be
-                               # handled as unknown sympy functions.
-                               (IntrinsicCall.Intrinsic.EXP, "exp"),
-                               ]:
-            self._intrinsic.add(intr_str)
-            self._intrinsic_to_str[intr] = intr_str
-
     # -------------------------------------------------------------------------
     def __new__(cls, *expressions):
         '''This function allows the SymPy writer to be used in two
@@ -296,18 +290,21 @@ class SymPyWriter(FortranWriter):
         # conversion). First add all reserved names so that these names will
         # automatically be renamed. The symbol table is used later to also
         # create guaranteed unique names for lower and upper bounds.
+        # The reserved names are all distinct and the table is empty, so
+        # they can be added directly without searching for a free name.
         self._symbol_table = SymbolTable()
         for reserved in SymPyWriter._RESERVED_NAMES:
-            self._symbol_table.new_symbol(reserved)
+            self._symbol_table.add(Symbol(reserved))
 
         # Set-up whether we should assume all Symbols are positive.
         assumptions = {}
         if all_variables_positive:
             assumptions["positive"] = True
 
-        # Find each reference in each of the expression, and declare this name
-        # as either a SymPy Symbol (scalar reference), or a SymPy Function
-        # (an array).
+        # Find each reference in each of the expression. Only the first
+        # reference to each name is needed, so collect them first, which
+        # means that the checks below are only done once per name.
+        first_refs = {}
         for expr in list_of_expressions:
             # TODO #2542. References should be iterated with the
             # reference_acess method when its issues are fixed.
@@ -315,32 +312,29 @@ class SymPyWriter(FortranWriter):
                 if (isinstance(ref.parent, Call) and
                         ref.parent.children[0] is ref):
                     continue
-
-                name = ref.name
-                # The reserved Python keywords do not have tags, so they
-                # will not be found.
-                if name in self._symbol_table.tags_dict:
-                    continue
-
-                # Any symbol from the list of expressions to be handled
-                # will be created with a tag, so if the same symbol is
-                # used more than once, the previous test will prevent
-                # calling new_symbol again. If the name is a Python
-                # reserved symbol, a new unique name will be created by
-                # the symbol table.
-                unique_sym = self._symbol_table.new_symbol(name, tag=name)
-                # Test if an array or an array expression is used:
-                if not ref.is_array:
-                    self._sympy_type_map[unique_sym.name] = sympy.Symbol(
-                        name, **assumptions)
-                    continue
-
-                # A Fortran array is used which has not been seen before.
-                # Declare a new SymPy function for it. This SymPy function
-                # will convert array expressions back into the original
-                # Fortran code.
-                self._sympy_type_map[unique_sym.name] = \
-                    self._create_sympy_array_function(name)
+                first_refs.setdefault(ref.name, ref)
+
+        # Declare each name as either a SymPy Symbol (scalar reference),
+        # or a SymPy Function (an array).
+        for name, ref in first_refs.items():
+            # Any symbol from the list of expressions to be handled
+            # will be created with a tag. If the name is a Python
+            # reserved symbol, a new unique name will be created by
+            # the symbol table (the reserved Python keywords do not
+            # have tags, so they are never found as a tag).
+            unique_sym = self._symbol_table.new_symbol(name, tag=name)
+            # Test if an array or an array expression is used:
+            if not ref.is_array:
+                self._sympy_type_map[unique_sym.name] = sympy.Symbol(
+                    name, **assumptions)
+                continue
+
+            # A Fortran array is used which has not been seen before.
+            # Declare a new SymPy function for it. This SymPy function
+            # will convert array expressions back into the original
+            # Fortran code.
+            self._sympy_type_map[unique_sym.name] = \
+                self._create_sympy_array_function(name)
 
         if not identical_variables:
             identical_variables = {}
@@ -491,13 +485,30 @@ class SymPyWriter(FortranWriter):
             list_of_expressions, identical_variables=identical_variables,
             all_variables_positive=all_variables_positive)
 
-        result = []
-        for expr in expression_str_list:
+        result = None
+        if len(expression_str_list) > 1:
+            # Parsing has a significant fixed overhead per call, so first
+            # try to parse all expressions at once as a single tuple. If
+            # this fails (e.g. because one expression is invalid), or does
+            # not return one result per expression, fall back to parsing
+            # them one by one below, which also identifies the invalid one.
+            combined = "(" + ", ".join(expression_str_list) + ",)"
             try:
-                result.append(parse_expr(expr, self.type_map))
-            except SyntaxError as err:
-                raise VisitorError(f"Invalid SymPy expression: '{expr}'.") \
-                    from err
+                parsed = parse_expr(combined, self.type_map)
+                if isinstance(parsed, tuple) and \
+                        len(parsed) == len(expression_str_list):
+                    result = list(parsed)
+            except SyntaxError:
+                pass
+
+        if result is None:
+            result = []
+            for expr in expression_str_list:
+                try:
+                    result.append(parse_expr(expr, self.type_map))
+                except SyntaxError as err:
+                    raise VisitorError(f"Invalid SymPy expression: "
+                                       f"'{expr}'.") from err
 
         if is_list:
             return result
@@ -556,25 +567,22 @@ class SymPyWriter(FortranWriter):
         '''
         sig, indices = node.get_signature_and_indices()
 
-        out = []
+        # Collect the number of indices of each component, and all indices
+        # in one flat list, in a single pass over the components:
         num_dims = []
         all_dims = []
-        is_array = False
-        for i, name in enumerate(sig):
-            num_dims.append(len(indices[i]))
-            for index in indices[i]:
-                all_dims.append(index)
-                is_array = True
-            out.append(name)
-        flat_name = "_".join(out)
+        for component_indices in indices:
+            num_dims.append(len(component_indices))
+            all_dims.extend(component_indices)
 
         # Find (or create) a unique variable name:
+        sig_str = str(sig)
         try:
-            unique_name = self._symbol_table.lookup_with_tag(str(sig)).name
+            unique_name = self._symbol_table.lookup_with_tag(sig_str).name
         except KeyError:
-            unique_name = self._symbol_table.new_symbol(flat_name,
-                                                        tag=str(sig)).name
-        if is_array:
+            unique_name = self._symbol_table.new_symbol("_".join(sig),
+                                                        tag=sig_str).name
+        if all_dims:
             indices_str = self.gen_indices(all_dims)
             # Create the corresponding SymPy function, which will store
             # the signature and num_dims, so that the correct Fortran
@@ -608,11 +616,12 @@ class SymPyWriter(FortranWriter):
             is not supported with SymPy.
 
         '''
-        if node.datatype.intrinsic == ScalarType.Intrinsic.BOOLEAN:
+        intrinsic = node.datatype.intrinsic
+        if intrinsic == ScalarType.Intrinsic.BOOLEAN:
             # Booleans need to be converted to SymPy format
             return node.value.capitalize()
 
-        if node.datatype.intrinsic == ScalarType.Intrinsic.CHARACTER:
+        if intrinsic == ScalarType.Intrinsic.CHARACTER:
             raise TypeError(f"SymPy cannot handle strings "
                             f"like '{node.value}'.")
         # All real (single, double precision) and integer work by just
@@ -621,11 +630,33 @@ class SymPyWriter(FortranWriter):
         # information can be ignored.
         return node.value
 
+    def _gen_arguments(self, node):
+        '''Creates the list of arguments for a call. SymPy does not support
+        argument names, so for an IntrinsicCall all arguments are written
+        as positional arguments (without modifying the PSyIR node).
+        Any other call is handled by the base class.
+
+        :param node: the node for which to create the arguments.
+        :type node: :py:class:`psyclone.psyir.nodes.Call`
+
+        :returns: string representation of the complete list of arguments.
+        :rtype: str
+
+        '''
+        # TODO #2302: This is not totally right without canonical intrinsic
+        # positions for arguments. One alternative is to refuse it with a
+        # VisitorError, but this leaves sympy comparisons almost always
+        # giving false when out of order arguments are rare, so instead we
+        # ignore it for now.
+        if isinstance(node, IntrinsicCall):
+            return ", ".join(self._visit(arg) for arg in node.arguments)
+        return super()._gen_arguments(node)
+
     def intrinsiccall_node(self, node):
         ''' This method is called when an IntrinsicCall instance is found in
         the PSyIR tree. The Sympy backend will use the exact sympy name for
-        some math intrinsics (listed in _intrinsic_to_str) and will remove
-        named arguments.
+        some math intrinsics (listed in _INTRINSIC_TO_STR) and will remove
+        named arguments (see _gen_arguments).
 
         :param node: an IntrinsicCall PSyIR node.
         :type node: :py:class:`psyclone.psyir.nodes.IntrinsicCall`
@@ -634,30 +665,11 @@ class SymPyWriter(FortranWriter):
         :rtype: str
 
         '''
-        # Sympy does not support argument names, remove them for now
-        if any(node.argument_names):
-            # TODO #2302: This is not totally right without canonical intrinsic
-            # positions for arguments. One alternative is to refuse it with:
-            # raise VisitorError(
-            #     f"Named arguments are not supported by SymPy but found: "
-            #     f"'{node.debug_string()}'.")
-            # but this leaves sympy comparisons almost always giving false when
-            # out of order arguments are rare, so instead we ignore it for now.
-
-            # It makes a copy (of the parent because if matters to the call
-            # visitor) because we don't want to delete the original arg names
-            parent = node.parent.copy()
-            node = parent.children[node.position]
-            for idx in range(len(node.argument_names)):
-                # pylint: disable=protected-access
-                node._argument_names[idx] = (node._argument_names[idx][0],
-                                             None)
-        try:
-            name = self._intrinsic_to_str[node.intrinsic]
-            args = self._gen_arguments(node)
-            return f"{self._nindent}{name}({args})"
-        except KeyError:
+        name = self._INTRINSIC_TO_STR.get(node.intrinsic)
+        if name is None:
             return super().call_node(node)
+        args = self._gen_arguments(node)
+        return f"{self._nindent}{name}({args})"
 
     # -------------------------------------------------------------------------
     def reference_node(self, node):
@@ -690,12 +702,9 @@ class SymPyWriter(FortranWriter):
         # Now this must be an array expression without parenthesis. Add
         # the triple-array indices to represent `lower:upper:1` for each
         # dimension:
-        shape = node.symbol.shape
-        result = [f"{self.lower_bound},"
-                  f"{self.upper_bound},1"]*len(shape)
-
-        return (f"{name}{self.array_parenthesis[0]}"
-                f"{','.join(result)}{self.array_parenthesis[1]}")
+        triple = f"{self._lower_bound},{self._upper_bound},1"
+        indices = ",".join([triple] * len(node.symbol.shape))
+        return f"{name}{self._open_paren}{indices}{self._close_paren}"
 
     # ------------------------------------------------------------------------
     def gen_indices(self, indices, var_name=None):
@@ -720,11 +729,13 @@ class SymPyWriter(FortranWriter):
         '''
         dims = []
         for index in indices:
+            # The checks are ordered by frequency: almost all indices are
+            # DataNodes (e.g. array accesses), so this is tested first.
             if isinstance(index, DataNode):
                 # literal constant, symbol reference, or computed
                 # dimension
                 expression = self._visit(index)
-                dims.extend([expression, expression, "1"])
+                dims.extend((expression, expression, "1"))
             elif isinstance(index, Range):
                 # literal constant, symbol reference, or computed
                 # dimension
@@ -735,10 +746,10 @@ class SymPyWriter(FortranWriter):
                 # by literal constant, symbol reference, or computed dimension
                 lower_expression = self._visit(index.lower)
                 upper_expression = self._visit(index.upper)
-                dims.extend([lower_expression, upper_expression, "1"])
+                dims.extend((lower_expression, upper_expression, "1"))
             elif isinstance(index, ArrayType.Extent):
                 # unknown extent
-                dims.extend([self.lower_bound, self.upper_bound, "1"])
+                dims.extend((self._lower_bound, self._upper_bound, "1"))
             else:
                 raise NotImplementedError(
                     f"unsupported gen_indices index '{index}'")
@@ -757,24 +768,27 @@ class SymPyWriter(FortranWriter):
         :rtype: str
 
         '''
-        if node.parent and node.parent.is_lower_bound(
-                node.parent.index_of(node)):
+        parent = node.parent
+        if parent:
+            # Find the position of this range in the parent only once
+            position = parent.index_of(node)
+            is_lower_bound = parent.is_lower_bound(position)
+            is_upper_bound = parent.is_upper_bound(position)
+        else:
+            is_lower_bound = is_upper_bound = False
+
+        if is_lower_bound:
             # The range starts for the first element in this
             # dimension, so use the generic name for lower bound:
-            start = self.lower_bound
+            start = self._lower_bound
         else:
             start = self._visit(node.start)
 
-        if node.parent and node.parent.is_upper_bound(
-                node.parent.index_of(node)):
+        if is_upper_bound:
             # The range ends with the last element in this
             # dimension, so use the generic name for the upper bound:
-            stop = self.upper_bound
+            stop = self._upper_bound
         else:
             stop = self._visit(node.stop)
-        result = f"{start},{stop}"
-
-        step = self._visit(node.step)
-        result += f",{step}"
 
-        return result
+        return f"{start},{stop},{self._visit(node.step)}"
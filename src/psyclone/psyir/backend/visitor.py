@@ -128,6 +128,10 @@ class PSyIRVisitor():
         #: global constraints validated.
         self._validate_nodes = check_global_constraints
         self._disable_copy = disable_copy
+        #: Maps each type of node visited to the method that handles it (or
+        #: None if there is no such method), so the search through the class
+        #: hierarchy in _visit is only done once per node type.
+        self._handlers = {}
 
     def reference_node(self, node):
         '''This method is called when a Reference instance is found in the
@@ -228,9 +232,6 @@ class PSyIRVisitor():
 
         :raises VisitorError: if a node is found that does not have \
             associated call back methods (and skip_nodes is not set).
-        :raises AttributeError: if a call back method is found but it \
-            raises an AttributeError.
-
         '''
         # pylint: disable=too-many-branches
         if not isinstance(node, Node):
@@ -242,82 +243,96 @@ class PSyIRVisitor():
         if self._validate_nodes:
             node.validate_global_constraints()
 
-        # Make a list of the node's ancestor classes (including
-        # itself) in method resolution order (mro), apart from the
-        # base "object" class.
-        possible_method_names = [curr_class.__name__.lower()+"_node"
-                                 for curr_class in inspect.getmro(type(node))]
-        possible_method_names.remove("object_node")
-
-        # Try to call methods using the class names in the order of
-        # the class hierarchy (starting from the current class name).
-        for method_name in possible_method_names:
-            try:
-                # pylint: disable=eval-used
-                node_result = eval(f"self.{method_name}(node)")
-
-                # We can only proceed to add comments if the Visitor
-                # returned a string, otherwise we just return
-                if not isinstance(node_result, str):
-                    return node_result
-
-                result = ""
-
-                # Add preceding comment if available
-                if isinstance(node, CommentableMixin):
-                    parent = node.parent
-                    valid_locations = (Schedule, Container)
-                    valid = parent and isinstance(parent, valid_locations)
-                    # And is in a location that allows line comments, e.g.
-                    # Schedules, Container and Standalone nodes (no-parent)
-                    if not parent or valid:
-                        if node.preceding_comment and self._COMMENT_PREFIX:
-                            lines = node.preceding_comment.split('\n')
-                            for line in lines:
-                                result += (self._nindent +
-                                           self._COMMENT_PREFIX +
-                                           line + "\n")
-
-                result += node_result
-
-                # Add inline comment if available
-                if isinstance(node, CommentableMixin):
-                    if node.inline_comment and self._COMMENT_PREFIX:
-                        if result[-1] != "\n":
-                            raise VisitorError(
-                                f"An inline_comment can only be added to a "
-                                f"construct that finishes with a '\\n', "
-                                f"indicating that the line has ended, but"
-                                f" node '{node}' results in '{result}'.")
-                        # Add the comment before the last line break
-                        result = (result[:-1] + "  " + self._COMMENT_PREFIX +
-                                  node.inline_comment + "\n")
-
-                return result
-
-            except AttributeError as excinfo:
-                if f"attribute '{method_name}'" in str(excinfo):
-                    # This attribute error is because the method that
-                    # was tried does not exist.
-                    pass
-                else:
-                    # The method does exist but it has raised an
-                    # attribute error so re-raise it here.
-                    raise AttributeError(excinfo) from excinfo
-
-        if self._skip_nodes:
-            # We haven't found a handler for this node but '_skip_nodes' is
-            # set so we ignore it and continue on down to any children.
-            results = []
-            for child in node.children:
-                result = self._visit(child)
-                if result is not None:
-                    results.append(result)
-            return "".join(results)
-
-        raise VisitorError(
-            f"Unsupported node '{type(node).__name__}' found: method names "
-            f"attempted were {possible_method_names}.")
+        # Find the method handling this type of node. The search is only
+        # done the first time a node type is encountered; after that the
+        # result is taken from the cache.
+        node_type = type(node)
+        try:
+            handler = self._handlers[node_type]
+        except KeyError:
+            handler = None
+            # Try the methods named after the classes in the hierarchy of
+            # the node (starting from the current class name).
+            for method_name in self._method_names(node_type):
+                handler = getattr(self, method_name, None)
+                if handler is not None:
+                    break
+            self._handlers[node_type] = handler
+
+        if handler is None:
+            if self._skip_nodes:
+                # We haven't found a handler for this node but '_skip_nodes'
+                # is set so we ignore it and continue on down to any
+                # children.
+                results = []
+                for child in node.children:
+                    result = self._visit(child)
+                    if result is not None:
+                        results.append(result)
+                return "".join(results)
+
+            raise VisitorError(
+                f"Unsupported node '{node_type.__name__}' found: method names "
+                f"attempted were {self._method_names(node_type)}.")
+
+        node_result = handler(node)
+
+        # We can only proceed to add comments if the Visitor
+        # returned a string, otherwise we just return
+        if not isinstance(node_result, str):
+            return node_result
+
+        result = ""
+
+        # Add preceding comment if available
+        if isinstance(node, CommentableMixin):
+            parent = node.parent
+            valid_locations = (Schedule, Container)
+            valid = parent and isinstance(parent, valid_locations)
+            # And is in a location that allows line comments, e.g.
+            # Schedules, Container and Standalone nodes (no-parent)
+            if not parent or valid:
+                if node.preceding_comment and self._COMMENT_PREFIX:
+                    lines = node.preceding_comment.split('\n')
+                    for line in lines:
+                        result += (self._nindent +
+                                   self._COMMENT_PREFIX +
+                                   line + "\n")
+
+        result += node_result
+
+        # Add inline comment if available
+        if isinstance(node, CommentableMixin):
+            if node.inline_comment and self._COMMENT_PREFIX:
+                if result[-1] != "\n":
+                    raise VisitorError(
+                        f"An inline_comment can only be added to a "
+                        f"construct that finishes with a '\\n', "
+                        f"indicating that the line has ended, but"
+                        f" node '{node}' results in '{result}'.")
+                # Add the comment before the last line break
+                result = (result[:-1] + "  " + self._COMMENT_PREFIX +
+                          node.inline_comment + "\n")
+
+        return result
+
+    @staticmethod
+    def _method_names(node_type):
+        '''
+        :param node_type: the class of a PSyIR node.
+        :type node_type: type
+
+        :returns: the names of the methods that can handle a node of the
+            given type, i.e. the lower-case names of the class and all its
+            ancestors (apart from "object") with "_node" appended, in
+            method resolution order.
+        :rtype: list[str]
+
+        '''
+        method_names = [curr_class.__name__.lower()+"_node"
+                        for curr_class in inspect.getmro(node_type)]
+        method_names.remove("object_node")
+        return method_names
 
 
 # For AutoAPI documentation generation
@@ -83,8 +83,7 @@ class ArrayMember(ArrayMixin, Member):
 
         obj = ArrayMember(member_name)
         # Add any array-index expressions as children
-        for child in indices:
-            obj.addchild(child)
+        obj.children = indices
         return obj
 
 
@@ -86,11 +86,9 @@ class ArrayOfStructuresMember(ArrayOfStructuresMixin, StructureMember):
 
         '''
         obj = ArrayOfStructuresMember(member_name)
-        # Add the inner_member node as the first child
-        obj.addchild(inner_member)
-        # Add the array-index expressions as subsequent children
-        for child in indices:
-            obj.addchild(child)
+        # The inner_member node is the first child, followed by the
+        # array-index expressions
+        obj.children = [inner_member] + list(indices)
         return obj
 
 
@@ -130,8 +130,7 @@ class ArrayOfStructuresReference(ArrayOfStructuresMixin, StructureReference):
 
         # Then add the array-index expressions. We don't validate the children
         # as that is handled in _validate_child.
-        for child in indices:
-            ref.addchild(child)
+        ref.children.extend(indices)
         return ref
 
 
@@ -42,7 +42,7 @@ from psyclone.psyir.nodes.scoping_node import ScopingNode
 from psyclone.psyir.nodes.routine import Routine
 from psyclone.psyir.nodes.codeblock import CodeBlock
 from psyclone.psyir.symbols import (GenericInterfaceSymbol, RoutineSymbol,
-                                    Symbol, SymbolTable)
+                                    Symbol, SymbolError, SymbolTable)
 from psyclone.errors import GenerationError
 from psyclone.psyir.commentable_mixin import CommentableMixin
 
@@ -80,9 +80,13 @@ class Container(ScopingNode, CommentableMixin):
         :returns: whether other is equal to self.
         :rtype: bool
         '''
-        is_eq = super().__eq__(other)
-        is_eq = is_eq and self.name == other.name
-        return is_eq
+        if self is other:
+            return True
+        # Compare the type and name first, since this is much cheaper than
+        # comparing the symbol tables and all children.
+        if type(self) is not type(other) or self.name != other.name:
+            return False
+        return super().__eq__(other)
 
     @staticmethod
     def _validate_child(position, child):
@@ -197,10 +201,6 @@ class Container(ScopingNode, CommentableMixin):
 
         '''
         rname = name.lower()
-        # pylint: disable=import-outside-toplevel
-        from psyclone.psyir.nodes.routine import Routine
-        from psyclone.psyir.symbols.symbol import Symbol, SymbolError
-        # pylint: enable=import-outside-toplevel
 
         # Is the Routine defined within this Container?
         for node in self.children:
@@ -219,11 +219,8 @@ class Container(ScopingNode, CommentableMixin):
         # It's not defined in this Container so look in the import that names
         # the routine if there is one.
         table = self.symbol_table
-        try:
-            routine_sym = table.lookup(rname)
-        except KeyError:
-            # Routine does not exist in the SymbolTable.
-            routine_sym = None
+        # This returns None if the Routine does not exist in the SymbolTable.
+        routine_sym = table.lookup(rname, otherwise=None)
 
         if routine_sym:
             if isinstance(routine_sym, GenericInterfaceSymbol):
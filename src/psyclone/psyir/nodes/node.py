@@ -1082,21 +1082,38 @@ class Node():
 
         '''
         local_list = []
-        if isinstance(self, my_type) and depth in [None, self.depth]:
-            local_list.append(self)
-
-        # Stop recursion further into the tree if an instance of a class
-        # listed in stop_type is found.
-        if stop_type and isinstance(self, stop_type):
-            return local_list
-
-        # Stop recursion further into the tree if a depth level has been
-        # specified and it is reached.
-        if depth is not None and self.depth >= depth:
+        # The tree is traversed iteratively with an explicit stack (rather
+        # than recursively) to avoid the overhead of a function call and a
+        # temporary list per node. The children are pushed in reverse order
+        # so that nodes are still returned in pre-order. The depth of each
+        # node is tracked alongside it (if required) so that it does not
+        # have to be recomputed by walking up the tree for every node.
+        if depth is None:
+            stack = [self]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, my_type):
+                    local_list.append(node)
+                # Stop recursion further into the tree if an instance of a
+                # class listed in stop_type is found.
+                if stop_type and isinstance(node, stop_type):
+                    continue
+                stack.extend(reversed(node.children))
             return local_list
 
-        for child in self.children:
-            local_list += child.walk(my_type, stop_type, depth=depth)
+        stack = [(self, self.depth)]
+        while stack:
+            node, node_depth = stack.pop()
+            if isinstance(node, my_type) and node_depth == depth:
+                local_list.append(node)
+            if stop_type and isinstance(node, stop_type):
+                continue
+            # Stop recursion further into the tree if the specified depth
+            # level is reached.
+            if node_depth >= depth:
+                continue
+            stack.extend((child, node_depth + 1)
+                         for child in reversed(node.children))
         return local_list
 
     def get_sibling_lists(self, my_type, stop_type=None):
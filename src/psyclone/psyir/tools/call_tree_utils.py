@@ -71,7 +71,7 @@ class CallTreeUtils():
             accesses
         :type routine: :py:class:`psyclone.psyir.nodes.Routine`
 
-        :returns: list of non-local references
+        :returns: list of non-local references, without duplicates.
         :rtype: list[tuple[str, str, :py:class:`psyclone.core.Signature`]]
 
 
@@ -156,7 +156,10 @@ class CallTreeUtils():
                     sym.name == routine.return_symbol.name:
                 continue
 
-        return non_locals
+        # A symbol is typically accessed more than once in a routine. Remove
+        # duplicated entries (preserving the order) so each non-local is
+        # only handled once by the callers.
+        return list(dict.fromkeys(non_locals))
 
     # -------------------------------------------------------------------------
     def get_input_parameters(self, read_write_info, node_list,
@@ -352,6 +355,12 @@ class CallTreeUtils():
         # pylint: disable=too-many-statements
         mod_manager = ModuleManager.get()
         done = set()
+        # The (module name, routine name) of all routines whose non-local
+        # symbols have already been added to the list of outstanding
+        # non-locals. A routine can be reached via several accesses (each
+        # with its own access information), but only needs to be analysed
+        # once.
+        analysed_routines = set()
         # Using a set here means that duplicated entries will automatically
         # be filtered out.
         in_vars = set()
@@ -400,10 +409,14 @@ class CallTreeUtils():
                               f"Cannot find routine '{routine_name}' in module"
                               f" '{module_name}' - ignored.")
                         continue
+                    at_least_one_routine_found = True
+                    routine_key = (module_name, routine_name.lower())
+                    if routine_key in analysed_routines:
+                        continue
+                    analysed_routines.add(routine_key)
                     # Add the list of non-locals to our todo list:
                     outstanding_nonlocals.extend(
                         self.get_non_local_symbols(routine))
-                    at_least_one_routine_found = True
 
                 if not at_least_one_routine_found:
                     print(f"[CallTreeUtils._resolve_calls_and_unknowns] "
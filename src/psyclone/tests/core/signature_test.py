@@ -68,6 +68,8 @@ def test_signature():
     assert len(sig) == 3
     assert Signature(["a", "b", "c"]).is_structure
     assert not Signature(("a")).is_structure
+    # Signatures do not have a per-instance dictionary:
+    assert not hasattr(sig, "__dict__")
 
     # Check that structure expressions (using '%') are automatically split
     # into components:
@@ -116,32 +116,23 @@ def test_node_list_error(tmpdir):
     assert LFRicBuild(tmpdir).code_compiles(psy)
 
 
-def test_distmem_error():
+@pytest.mark.parametrize("filename, selection", [
+    # Node(s) containing a HaloExchange
+    ("1_single_invoke.f90", slice(2, 4)),
+    # Node containing a GlobalSum
+    ("15.14.3_sum_setval_field_builtin.f90", 2)])
+def test_distmem_error(filename, selection):
     ''' Test that applying ExtractRegionTrans with distributed memory
     enabled raises a TransformationError if a node is included that
     is not supported. '''
     etrans = LFRicExtractTrans()
 
     # Test Dynamo0.3 API with distributed memory
-    _, invoke = get_invoke("1_single_invoke.f90", DYNAMO_API,
-                           idx=0, dist_mem=True)
+    _, invoke = get_invoke(filename, DYNAMO_API, idx=0, dist_mem=True)
     schedule = invoke.schedule
 
-    # Try applying Extract transformation to Node(s) containing HaloExchange
     with pytest.raises(TransformationError) as excinfo:
-        etrans.apply(schedule.children[2:4])
-    assert ("cannot be enclosed by a "
-            "LFRicExtractTrans transformation") in str(excinfo.value)
-
-    # Try applying Extract transformation to Node(s) containing GlobalSum
-    _, invoke = get_invoke("15.14.3_sum_setval_field_builtin.f90",
-                           DYNAMO_API, idx=0, dist_mem=True)
-    schedule = invoke.schedule
-    glob_sum = schedule.children[2]
-
-    with pytest.raises(TransformationError) as excinfo:
-        etrans.apply(glob_sum)
-
+        etrans.apply(schedule.children[selection])
     assert ("cannot be enclosed by a "
             "LFRicExtractTrans transformation") in str(excinfo.value)
 
@@ -254,11 +245,12 @@ def test_extract_node_position():
     abspos = children[0].abs_position
     dpth = children[0].depth
     dynetrans.apply(children)
-    extract_node = schedule.walk(ExtractNode)
-    # The result is only one ExtractNode in the list with position 0
-    assert extract_node[0].position == pos
-    assert extract_node[0].abs_position == abspos
-    assert extract_node[0].depth == dpth
+    # The ExtractNode must replace the first of the extracted Nodes
+    extract_node = schedule.children[pos]
+    assert isinstance(extract_node, ExtractNode)
+    assert extract_node.position == pos
+    assert extract_node.abs_position == abspos
+    assert extract_node.depth == dpth
 
 
 def test_extract_node_representation():
@@ -278,14 +270,14 @@ def test_extract_node_representation():
     assert expected_output in output
 
     # Test __str__ method
-
+    sched_str = str(schedule)
     assert "End LFRicLoop\nExtractStart[var=extract_psy_data]\nLFRicLoop[" \
-        in str(schedule)
+        in sched_str
     assert "End LFRicLoop\nExtractEnd[var=extract_psy_data]\nLFRicLoop[" in \
-        str(schedule)
+        sched_str
     # Count the loops inside and outside the extract to check it is in
     # the right place
-    [before, after] = str(schedule).split("ExtractStart")
+    [before, after] = sched_str.split("ExtractStart")
     [inside, after] = after.split("ExtractEnd")
     assert before.count("Loop[") == 1
     assert inside.count("Loop[") == 2
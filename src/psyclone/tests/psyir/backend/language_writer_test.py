@@ -46,7 +46,7 @@ from psyclone.psyir.backend.visitor import VisitorError
 from psyclone.psyir.symbols import ArrayType, DataSymbol, DataTypeSymbol, \
     INTEGER_TYPE, REAL_TYPE, Symbol, StructureType
 from psyclone.psyir.nodes import ArrayOfStructuresReference, ArrayReference, \
-    Literal, Member, StructureReference
+    Literal, Member, Reference, StructureReference
 from psyclone.tests.utilities import Compile
 
 
@@ -74,8 +74,20 @@ def test_language_writer_constructor_errors():
     for invalid_structure_character in [123, []]:
         with pytest.raises(TypeError) as err:
             _ = LanguageWriter(("(", ")"), invalid_structure_character)
-        assert "Invalid structure_character parameter, must be " \
-               "a string, got '" in str(err.value)
+        assert (f"Invalid structure_character parameter, must be "
+                f"a string, got '{invalid_structure_character}'."
+                in str(err.value))
+
+
+def test_lw_gen_indices_str(fortran_writer):
+    '''Check that gen_indices_str returns the comma-separated indices
+    created by the language-specific gen_indices method.
+
+    '''
+    symbol = DataSymbol("n", INTEGER_TYPE)
+    indices = [Literal("1", INTEGER_TYPE), Reference(symbol)]
+    assert fortran_writer.gen_indices_str(indices) == "1,n"
+    assert fortran_writer.gen_indices_str(indices[:1]) == "1"
 
 
 def test_lw_arrayreference_incomplete(fortran_writer):
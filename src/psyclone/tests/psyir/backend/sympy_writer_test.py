@@ -186,6 +186,26 @@ def test_sym_writer_functions(fortran_reader, expressions):
     assert SymPyWriter()._to_str(function) == expressions[1]
 
 
+def test_sym_writer_intrinsic_named_arguments(fortran_reader):
+    '''Test that the names of intrinsic arguments are removed (since SymPy
+    does not support them), without modifying the original PSyIR.
+
+    '''
+    source = '''program test_prog
+                integer :: i, x
+                real :: a(10)
+                x = SUM(a, dim=1) + MAX(x, a2=i)
+                end program test_prog '''
+
+    psyir = fortran_reader.psyir_from_source(source)
+    expr = psyir.children[0].children[0].rhs
+    assert SymPyWriter()._to_str(expr) == ("SUM(a(sympy_lower,sympy_upper,1)"
+                                           ", 1) + Max(x, i)")
+    # The argument names in the PSyIR must be unchanged
+    assert expr.children[0].argument_names == [None, "dim"]
+    assert expr.children[1].argument_names == [None, "a2"]
+
+
 @pytest.mark.parametrize("expr, sym_map", [("i", {'i': Symbol('i')}),
                                            ("f(1)", {'f': Function('f')}),
                                            ("f(:)", {'f': Function('f')}),
@@ -367,6 +387,16 @@ def test_sym_writer_parse_errors(fortran_reader):
             "'a(sympy_lower,sympy_upper,1) /= b(sympy_lower,sympy_upper,1)'"
             in str(err.value))
 
+    # If a list of expressions is converted (which are first parsed all
+    # at once), the invalid expression must still be reported.
+    exp2 = psyir.children[0].children[0].lhs
+    with pytest.raises(VisitorError) as err:
+        _ = SymPyWriter(exp2, exp1)
+
+    assert ("Visitor Error: Invalid SymPy expression: "
+            "'a(sympy_lower,sympy_upper,1) /= b(sympy_lower,sympy_upper,1)'"
+            in str(err.value))
+
 
 @pytest.mark.parametrize("expressions", [("b(i)", "b(i,i,1)"),
                                          ("b(:)",
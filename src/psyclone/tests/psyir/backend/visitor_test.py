@@ -55,6 +55,7 @@ def test_psyirvisitor_defaults():
     assert visitor._indent == "  "
     assert visitor._depth == 0
     assert visitor._validate_nodes is True
+    assert visitor._handlers == {}
 
 
 def test_psyirvisitor_init():
@@ -283,12 +284,9 @@ def test_psyirvisitor_visit_no_method2():
 
 
 def test_psyirvisitor_visit_attribute_error():
-    '''Check that an Attribute Error is raised if the method for the Node
-    class does exist and the method itself raises an Attribute
-    Error. This is checked because AttributeError is used to catch a
-    method not existing. Therefore an AttributeError raised by a
-    method that does exist could be mistaken as meaning that the
-    method does not exist.
+    '''Check that an AttributeError raised inside an existing handler
+    method propagates unchanged, i.e. it is not mistaken for the handler
+    not existing.
 
     '''
     class MyPSyIRVisitor(PSyIRVisitor):
@@ -323,6 +321,40 @@ def test_psyirvisitor_visit_all_parents():
         "" in str(excinfo.value))
 
 
+def test_psyirvisitor_visit_handler_cache():
+    '''Check that the method handling each type of node is only searched
+    for the first time a node of that type is visited.
+
+    '''
+    class Parent(Node):
+        '''Subclass of Node whose instances are handled by the
+        parent_node method.'''
+
+    class Child(Parent):
+        '''Subclass of Parent that has no handler of its own.'''
+
+    class MyPSyIRVisitor(PSyIRVisitor):
+        '''Subclass PSyIRVisitor to handle the Parent class.'''
+        def parent_node(self, node):
+            ''' Return the name of the class of the node. '''
+            return type(node).__name__
+
+    visitor = MyPSyIRVisitor()
+    assert visitor._visit(Child()) == "Child"
+    assert visitor._handlers == {Child: visitor.parent_node}
+    assert visitor._visit(Parent()) == "Parent"
+    assert visitor._handlers[Parent] == visitor.parent_node
+    # A type that has no handler is cached as None.
+    with pytest.raises(VisitorError) as excinfo:
+        visitor._visit(Node())
+    assert visitor._handlers[Node] is None
+    assert ("method names attempted were ['node_node']"
+            in str(excinfo.value))
+    # Replace the cached handler to check that it is used directly.
+    visitor._handlers[Child] = lambda _: "cached"
+    assert visitor._visit(Child()) == "cached"
+
+
 def test_psyirvisitor_visit_skip_nodes():
     '''Check that when the skip_nodes variable is set to true then child
     nodes are called irrespective of whether a parent node has a
@@ -53,8 +53,6 @@ from psyclone.psyir.nodes import (
 from psyclone.psyir.commentable_mixin import CommentableMixin
 from psyclone.psyir.symbols import DataTypeSymbol, StructureType
 
-from psyclone.psyir.backend.fortran import FortranWriter
-
 # Test code
 CODE = """
 ! Comment on module 'test_mod'
@@ -126,10 +124,9 @@ end module test_mod
 """
 
 
-def test_no_comments():
+def test_no_comments(fortran_reader):
     """Test that the FortranReader is without comments by default"""
-    reader = FortranReader()
-    psyir = reader.psyir_from_source(CODE)
+    psyir = fortran_reader.psyir_from_source(CODE)
 
     module = psyir.children[0]
     assert isinstance(module, Container)
@@ -157,13 +154,25 @@ def test_no_comments():
     assert len(routine.walk(CodeBlock)) == 0
 
 
-@pytest.mark.parametrize("last_comments_as_codeblocks", [True, False])
-def test_comments_and_codeblocks(last_comments_as_codeblocks):
+@pytest.fixture(name="psyir_with_comments", scope="module",
+                params=[True, False])
+def psyir_with_comments_fixture(request):
+    """Creates the PSyIR of CODE with comments, with and without the last
+    comments being kept as CodeBlocks. The PSyIR is shared by all tests in
+    this module (which must not modify it), so CODE is only parsed once
+    for each setting.
+
+    :returns: the value of last_comments_as_codeblocks and the PSyIR.
+    :rtype: Tuple[bool, :py:class:`psyclone.psyir.nodes.FileContainer`]
+    """
+    reader = FortranReader(ignore_comments=False,
+                           last_comments_as_codeblocks=request.param)
+    return request.param, reader.psyir_from_source(CODE)
+
+
+def test_comments_and_codeblocks(psyir_with_comments):
     """Test that the FortranReader is able to read comments"""
-    reader = FortranReader(
-        ignore_comments=False,
-        last_comments_as_codeblocks=last_comments_as_codeblocks)
-    psyir = reader.psyir_from_source(CODE)
+    last_comments_as_codeblocks, psyir = psyir_with_comments
 
     module = psyir.children[0]
     assert (
@@ -455,16 +464,10 @@ end module test_mod
 """
 
 
-@pytest.mark.parametrize("last_comments_as_codeblocks", [True, False])
-def test_write_comments(last_comments_as_codeblocks):
+def test_write_comments(psyir_with_comments, fortran_writer):
     """Test that the comments are written back to the code"""
-    reader = FortranReader(
-        ignore_comments=False,
-        last_comments_as_codeblocks=last_comments_as_codeblocks
-    )
-    writer = FortranWriter()
-    psyir = reader.psyir_from_source(CODE)
-    generated_code = writer(psyir)
+    last_comments_as_codeblocks, psyir = psyir_with_comments
+    generated_code = fortran_writer(psyir)
     if last_comments_as_codeblocks:
         assert generated_code == EXPECTED_WITH_COMMENTS_AND_CODEBLOCKS
     else:
@@ -523,12 +526,11 @@ end subroutine test_sub
     reason="Directive is written back as '! $omp parallel do'"
     "instead of '!$omp parallel do'"
 )
-def test_write_directives():
+def test_write_directives(fortran_writer):
     """Test that the directives are written back to the code"""
     reader = FortranReader(ignore_comments=False, ignore_directives=False)
-    writer = FortranWriter()
     psyir = reader.psyir_from_source(CODE_WITH_DIRECTIVE)
-    generated_code = writer(psyir)
+    generated_code = fortran_writer(psyir)
     assert generated_code == EXPECTED_WITH_DIRECTIVES
 
 
@@ -67,6 +67,11 @@ def test_container_equality():
     container3._symbol_table = symboltable
     assert container1 == container2
     assert container1 != container3
+    # Comparing a Container with itself takes the identity short-cut
+    assert container1.__eq__(container1)
+    # A different type is never equal (even if it has the same name)
+    assert container1 != FileContainer("test")
+    assert container1 != "test"
 
 
 def test_container_init_parent():
@@ -137,15 +137,13 @@ def test_extract_node_equality():
 
 
 # ---------------------------------------------------------------------------
-def test_malformed_extract_node(monkeypatch):
+@pytest.mark.parametrize("num_children", [0, 2])
+def test_malformed_extract_node(monkeypatch, num_children):
     ''' Check that we raise the expected error if an ExtractNode does not have
     a single Schedule node as its child. '''
     enode = ExtractNode()
-    monkeypatch.setattr(enode, "_children", [])
-    with pytest.raises(InternalError) as err:
-        _ = enode.extract_body
-    assert "malformed or incomplete. It should have a " in str(err.value)
-    monkeypatch.setattr(enode, "_children", [Node(), Node()])
+    monkeypatch.setattr(enode, "_children",
+                        [Node() for _ in range(num_children)])
     with pytest.raises(InternalError) as err:
         _ = enode.extract_body
     assert "malformed or incomplete. It should have a " in str(err.value)
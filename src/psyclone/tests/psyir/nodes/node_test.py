@@ -1700,6 +1700,47 @@ def test_walk_depth(fortran_reader):
     assert len(psyir.walk(Loop, depth=depth)) == 0
 
 
+def test_walk_order_and_stop_type(fortran_reader):
+    '''Test that Node's walk method returns the nodes in pre-order (the
+    same order as a recursive traversal) and honours stop_type, also in
+    combination with a depth restriction.'''
+
+    code = '''subroutine test_order()
+    integer :: i, j, a, b
+    a = 1
+    do i = 1, 2
+      do j = 1, 2
+        b = i + j
+      end do
+      a = b
+    end do
+    end subroutine'''
+
+    psyir = fortran_reader.psyir_from_source(code)
+    routine = psyir.children[0]
+
+    def recursive_walk(node):
+        result = [node]
+        for child in node.children:
+            result.extend(recursive_walk(child))
+        return result
+
+    assert psyir.walk(Node) == recursive_walk(psyir)
+    names = [ref.name for ref in routine.walk(Reference)]
+    assert names == ["a", "b", "i", "j", "a", "b"]
+
+    # Recursion stops at (but includes) the outer loop
+    loops = routine.walk(Loop, stop_type=Loop)
+    assert len(loops) == 1
+    assert [ref.name for ref in routine.walk(Reference, stop_type=Loop)] \
+        == ["a"]
+
+    # Combine stop_type with a depth restriction
+    depth = routine.depth + 1
+    assert routine.walk(Node, stop_type=Loop, depth=depth) == \
+        routine.children
+
+
 def test_get_sibling_lists(fortran_reader):
     '''Tests the get_sibling_lists functionality.'''
 
@@ -45,7 +45,6 @@ from enum import Enum
 import pytest
 
 from psyclone.errors import GenerationError, InternalError
-from psyclone.psyir.backend.fortran import FortranWriter
 from psyclone.psyir.nodes import (
     ArrayReference, BinaryOperation, colored, IntrinsicCall,
     Literal, Range, Reference, Return, StructureReference, UnaryOperation)
@@ -121,13 +120,12 @@ def test_binaryoperation_can_be_printed():
     binary_operation.addchild(op1)
     binary_operation.addchild(op2)
     # Check the node children are also printed
-    assert ("Literal[value:'1', Scalar<INTEGER, SINGLE>]\n"
-            in str(binary_operation))
-    assert ("Literal[value:'2', Scalar<INTEGER, SINGLE>]"
-            in str(binary_operation))
+    result = str(binary_operation)
+    assert "Literal[value:'1', Scalar<INTEGER, SINGLE>]\n" in result
+    assert "Literal[value:'2', Scalar<INTEGER, SINGLE>]" in result
 
 
-def test_binaryoperation_create():
+def test_binaryoperation_create(fortran_writer):
     '''Test that the create method in the BinaryOperation class correctly
     creates a BinaryOperation instance.
 
@@ -138,7 +136,7 @@ def test_binaryoperation_create():
     binaryoperation = BinaryOperation.create(oper, lhs, rhs)
     assert not binaryoperation._has_explicit_grouping
     check_links(binaryoperation, [lhs, rhs])
-    result = FortranWriter().binaryoperation_node(binaryoperation)
+    result = fortran_writer.binaryoperation_node(binaryoperation)
     assert result == "tmp1 + tmp2"
 
     # Check with the optional has_explicit_grouping parameter
@@ -147,33 +145,25 @@ def test_binaryoperation_create():
     assert binaryoperation.has_explicit_grouping
 
 
-def test_binaryoperation_create_invalid():
+@pytest.mark.parametrize("position, message", [
+    (0, "operator argument in create method of BinaryOperation class "
+        "should be a PSyIR BinaryOperation Operator but found 'str'."),
+    (1, "Item 'str' can't be child 0 of 'BinaryOperation'. The valid "
+        "format is: 'DataNode, DataNode'."),
+    (2, "Item 'str' can't be child 1 of 'BinaryOperation'. The valid "
+        "format is: 'DataNode, DataNode'.")])
+def test_binaryoperation_create_invalid(position, message):
     '''Test that the create method in a BinaryOperation class raises the
-    expected exception if the provided input is invalid.
+    expected exception if the provided operator, lhs or rhs is invalid.
 
     '''
-    ref1 = Reference(DataSymbol("tmp1", REAL_SINGLE_TYPE))
-    ref2 = Reference(DataSymbol("tmp2", REAL_SINGLE_TYPE))
-    add = BinaryOperation.Operator.ADD
-
-    # oper not a BinaryOperation.Operator.
-    with pytest.raises(GenerationError) as excinfo:
-        _ = BinaryOperation.create("invalid", ref1, ref2)
-    assert ("operator argument in create method of BinaryOperation class "
-            "should be a PSyIR BinaryOperation Operator but found 'str'."
-            in str(excinfo.value))
-
-    # lhs not a Node.
+    args = [BinaryOperation.Operator.ADD,
+            Reference(DataSymbol("tmp1", REAL_SINGLE_TYPE)),
+            Reference(DataSymbol("tmp2", REAL_SINGLE_TYPE))]
+    args[position] = "invalid"
     with pytest.raises(GenerationError) as excinfo:
-        _ = BinaryOperation.create(add, "invalid", ref2)
-    assert ("Item 'str' can't be child 0 of 'BinaryOperation'. The valid "
-            "format is: 'DataNode, DataNode'.") in str(excinfo.value)
-
-    # rhs not a Node.
-    with pytest.raises(GenerationError) as excinfo:
-        _ = BinaryOperation.create(add, ref1, "invalid")
-    assert ("Item 'str' can't be child 1 of 'BinaryOperation'. The valid "
-            "format is: 'DataNode, DataNode'.") in str(excinfo.value)
+        _ = BinaryOperation.create(*args)
+    assert message in str(excinfo.value)
 
 
 def test_binaryoperation_children_validation():
@@ -581,7 +571,7 @@ def test_unaryoperation_can_be_printed():
             in str(unary_operation))
 
 
-def test_unaryoperation_create():
+def test_unaryoperation_create(fortran_writer):
     '''Test that the create method in the UnaryOperation class correctly
     creates a UnaryOperation instance.
 
@@ -590,7 +580,7 @@ def test_unaryoperation_create():
     oper = UnaryOperation.Operator.MINUS
     unaryoperation = UnaryOperation.create(oper, child)
     check_links(unaryoperation, [child])
-    result = FortranWriter().unaryoperation_node(unaryoperation)
+    result = fortran_writer.unaryoperation_node(unaryoperation)
     assert result == "-tmp"
 
 
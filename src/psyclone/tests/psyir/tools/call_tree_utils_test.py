@@ -48,7 +48,7 @@ from psyclone.core import Signature, SingleVariableAccessInfo
 from psyclone.domain.lfric import LFRicKern
 from psyclone.parse import ModuleManager
 from psyclone.psyGen import BuiltIn, Kern
-from psyclone.psyir.nodes import CodeBlock, Reference, Schedule
+from psyclone.psyir.nodes import CodeBlock, Reference
 from psyclone.psyir.symbols import RoutineSymbol
 from psyclone.psyir.tools import CallTreeUtils, ReadWriteInfo
 from psyclone.tests.utilities import get_base_path, get_invoke
@@ -58,6 +58,11 @@ from psyclone.tests.utilities import get_base_path, get_invoke
 from psyclone.tests.parse.conftest \
     import mod_man_test_setup_directories  # noqa: F401
 
+LFRIC_BASE_PATH = get_base_path("lfric")
+DRIVER_CREATION_DIR = os.path.join(LFRIC_BASE_PATH, "driver_creation")
+BUILTIN_MOD_FILE = os.path.join("driver_creation",
+                                "module_with_builtin_mod.f90")
+
 
 # -----------------------------------------------------------------------------
 @pytest.mark.usefixtures("clear_module_manager_instance")
@@ -65,9 +70,8 @@ def test_call_tree_compute_all_non_locals_non_kernel():
     '''Test _compute_all_non_locals() functionality for source code
     that has no kernels.
     '''
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
     mod_info = mod_man.get_module_info("module_call_tree_mod")
 
     ctu = CallTreeUtils()
@@ -131,6 +135,32 @@ def test_call_tree_compute_all_non_locals_non_kernel():
     assert info == []
 
 
+# -----------------------------------------------------------------------------
+def test_call_tree_compute_all_non_locals_no_duplicates(fortran_reader):
+    '''Test that _compute_all_non_locals() reports a non-local symbol that
+    is accessed several times only once, and preserves the order in which
+    the symbols are first accessed.
+    '''
+    source = '''module my_mod
+                use other_mod, only: imported_var, imported_sub
+                integer :: module_var
+                contains
+                subroutine my_sub()
+                  module_var = module_var + imported_var
+                  call imported_sub()
+                  module_var = module_var * imported_var
+                  call imported_sub()
+                end subroutine my_sub
+                end module my_mod'''
+    psyir = fortran_reader.psyir_from_source(source)
+    routine = psyir.children[0].find_routine_psyir("my_sub")
+    ctu = CallTreeUtils()
+    info = ctu._compute_all_non_locals(routine)
+    assert info == [("reference", "my_mod", Signature("module_var")),
+                    ("unknown", "other_mod", Signature("imported_var")),
+                    ("routine", "other_mod", Signature("imported_sub"))]
+
+
 # -----------------------------------------------------------------------------
 @pytest.mark.usefixtures("clear_module_manager_instance")
 def test_call_tree_generic_functions():
@@ -139,9 +169,8 @@ def test_call_tree_generic_functions():
     able to determine the right function to be called due to missing type
     information.
     '''
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
     mod_info_call_tree = mod_man.get_module_info("module_call_tree_mod")
     # First make sure we get indeed all three functions (even though
     # one of the functions does not exist, which is required for testing
@@ -170,16 +199,15 @@ def test_call_tree_compute_all_non_locals_kernel():
     # We need to get the PSyIR after being processed by PSyclone, so that the
     # invoke-call and builtin has been replaced with the builtin/kernel
     # objects.
-    test_file = os.path.join("driver_creation", "module_with_builtin_mod.f90")
-    mod_psyir, _ = get_invoke(test_file, "lfric", 0, dist_mem=False)
+    mod_psyir, _ = get_invoke(BUILTIN_MOD_FILE, "lfric", 0,
+                              dist_mem=False)
     psyir = mod_psyir.invokes.invoke_list[0].schedule
 
-    # This will return three schedule - the LFRicInvokeSchedule, and two
-    # schedules for the kernel and builtin. Just make sure we have
-    # the right parts before doing the actual test:
-    schedules = psyir.walk(Schedule)
-    assert isinstance(schedules[1].children[0], LFRicKern)
-    assert isinstance(schedules[2].children[0], BuiltIn)
+    # The LFRicInvokeSchedule contains two loops, one for the kernel and
+    # one for the builtin. Just make sure we have the right parts before
+    # doing the actual test:
+    assert isinstance(psyir.children[0].loop_body.children[0], LFRicKern)
+    assert isinstance(psyir.children[1].loop_body.children[0], BuiltIn)
 
     ctu = CallTreeUtils()
     non_locals = ctu._compute_all_non_locals(psyir)
@@ -195,10 +223,8 @@ def test_call_tree_compute_all_non_locals_kernel():
 def test_call_tree_get_used_symbols_from_modules():
     '''Tests that we get the used symbols from a routine reported correctly.
     '''
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
-
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
 
     mod_info = mod_man.get_module_info("testkern_import_symbols_mod")
     container_node = mod_info.get_psyir()
@@ -206,8 +232,8 @@ def test_call_tree_get_used_symbols_from_modules():
     ctu = CallTreeUtils()
     non_locals = ctu.get_non_local_symbols(psyir)
 
-    non_locals_without_access = set((i[0], i[1], str(i[2]))
-                                    for i in non_locals)
+    non_locals_without_access = {(i[0], i[1], str(i[2]))
+                                 for i in non_locals}
     # Check that the expected symbols, modules and internal type are correct.
     # Note that a constant variable from another module is still reported here
     expected = set([
@@ -224,7 +250,7 @@ def test_call_tree_get_used_symbols_from_modules():
     assert non_locals_without_access == expected
 
     # Check the handling of a symbol that is not found: _compute_all_non_locals
-    # should return None:
+    # should return an empty list:
     ref = psyir.walk(Reference)[0]
     # Change the name of the symbol so that it is not in the symbol table:
     ref.symbol._name = "not-in-any-symbol-table"
@@ -239,10 +265,8 @@ def test_call_tree_get_used_symbols_from_modules_renamed():
     '''Tests that we get the used symbols from a routine reported correctly
     when a symbol is renamed, we need to get the original name.
     '''
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
-
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
 
     mod_info = mod_man.get_module_info("module_renaming_external_var_mod")
     container_node = mod_info.get_psyir()
@@ -267,13 +291,13 @@ def test_get_non_local_read_write_info(capsys):
     Config.get().api = "lfric"
     ctu = CallTreeUtils()
 
-    test_file = os.path.join("driver_creation", "module_with_builtin_mod.f90")
-    psyir, _ = get_invoke(test_file, "lfric", 0, dist_mem=False)
+    psyir, _ = get_invoke(BUILTIN_MOD_FILE, "lfric", 0,
+                          dist_mem=False)
     schedule = psyir.invokes.invoke_list[0].schedule
 
     # Set up the module manager with a search directory that does not
     # contain any files used here:
-    kernels_dir = os.path.join(get_base_path("lfric"),
+    kernels_dir = os.path.join(LFRIC_BASE_PATH,
                                "kernels", "dead_end", "no_really")
     mod_man = ModuleManager.get()
     mod_man.add_search_path(kernels_dir)
@@ -293,9 +317,8 @@ def test_get_non_local_read_write_info(capsys):
 
     # Now add the correct search path of the driver creation tests to the
     # module manager:
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
 
     # The example does contain an unknown subroutine (by design), and the
     # infrastructure directory has not been added, so constants_mod cannot
@@ -341,13 +364,12 @@ def test_get_non_local_read_write_info_errors(capsys):
     '''
     Config.get().api = "lfric"
     ctu = CallTreeUtils()
-    test_file = os.path.join("driver_creation", "module_with_builtin_mod.f90")
-    psyir, _ = get_invoke(test_file, "lfric", 0, dist_mem=False)
+    psyir, _ = get_invoke(BUILTIN_MOD_FILE, "lfric", 0,
+                          dist_mem=False)
     schedule = psyir.invokes.invoke_list[0].schedule
 
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
     kernels = schedule.walk(Kern)
     minfo = mod_man.get_module_info(kernels[0].module_name)
     cntr = minfo.get_psyir()
@@ -387,9 +409,8 @@ def test_call_tree_utils_resolve_calls_unknowns(capsys):
     # pylint: disable=too-many-statements
     # Add the search path of the driver creation tests to the
     # module manager:
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
 
     # Test if the internal todo handling cannot find a subroutine in the
     # module it is supposed to be in. Create a todo list indicating that
@@ -484,6 +505,38 @@ def test_call_tree_utils_resolve_calls_unknowns(capsys):
             "unknown symbol 'module_subroutine'" in out)
 
 
+# -----------------------------------------------------------------------------
+@pytest.mark.usefixtures("clear_module_manager_instance")
+def test_call_tree_utils_resolve_routine_once(monkeypatch):
+    '''Tests that a routine that is reached several times (with different
+    access information) is only analysed once.
+    '''
+    mod_man = ModuleManager.get()
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
+
+    ctu = CallTreeUtils()
+    analysed = []
+    orig_get_non_local_symbols = ctu.get_non_local_symbols
+
+    def counting_get_non_local_symbols(routine):
+        analysed.append(routine.name)
+        return orig_get_non_local_symbols(routine)
+
+    monkeypatch.setattr(ctu, "get_non_local_symbols",
+                        counting_get_non_local_symbols)
+    todo = [("routine", "module_with_var_mod",
+             Signature("module_subroutine"),
+             SingleVariableAccessInfo(Signature("module_subroutine")))
+            for _ in range(3)]
+    rw_info = ReadWriteInfo()
+    ctu._resolve_calls_and_unknowns(todo, rw_info)
+    assert analysed == ["module_subroutine"]
+    assert set(rw_info.read_list) == {("module_with_var_mod",
+                                       Signature("module_var_b")),
+                                      ("module_with_var_mod",
+                                       Signature("const_size_array"))}
+
+
 # -----------------------------------------------------------------------------
 @pytest.mark.usefixtures("change_into_tmpdir", "clear_module_manager_instance",
                          "mod_man_test_setup_directories")
@@ -510,9 +563,7 @@ def test_module_info_generic_interfaces():
     all_non_locals = []
     for routine_name in all_routines:
         all_non_locals.extend(
-            ctu.get_non_local_symbols(
-                mod_info.get_psyir().
-                find_routine_psyir(routine_name)))
+            ctu.get_non_local_symbols(cntr.find_routine_psyir(routine_name)))
     # Both functions of the generic interface use 'module_var',
     # and in addition my_func1 uses module_var_1, myfunc2 uses module_var_2
     # So three variables should be reported, i.e. module_var should only
@@ -527,7 +578,7 @@ def test_module_info_generic_interfaces():
                     ("reference", "g_mod", Signature("module_var"),
                      'module_var:WRITE(0)')])
     # Convert the access info to a string for easy comparison:
-    assert (set((i[0], i[1], i[2], str(i[3])) for i in all_non_locals) ==
+    assert ({(i[0], i[1], i[2], str(i[3])) for i in all_non_locals} ==
             expected)
 
 
@@ -607,13 +658,12 @@ def testcall_tree_utils_non_local_inout_parameters(capsys):
     '''
     ctu = CallTreeUtils()
 
-    test_file = os.path.join("driver_creation", "module_with_builtin_mod.f90")
-    psyir, _ = get_invoke(test_file, "lfric", 0, dist_mem=False)
+    psyir, _ = get_invoke(BUILTIN_MOD_FILE, "lfric", 0,
+                          dist_mem=False)
     schedule = psyir.invokes.invoke_list[0].schedule
 
-    test_dir = os.path.join(get_base_path("lfric"), "driver_creation")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(test_dir)
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
 
     # The example does contain an unknown subroutine (by design), and the
     # infrastructure directory has not been added, so constants_mod cannot
@@ -644,9 +694,8 @@ def test_call_tree_error_var_not_found(capsys):
     contain the variable is handled, i.e. printing a warning and otherwise
     ignores (TODO #2120)
     '''
-    dyn_test_dir = get_base_path("lfric")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(os.path.join(dyn_test_dir, "infrastructure"))
+    mod_man.add_search_path(os.path.join(LFRIC_BASE_PATH, "infrastructure"))
 
     read_write_info = ReadWriteInfo()
     ctu = CallTreeUtils()
@@ -665,9 +714,8 @@ def test_call_tree_error_module_is_codeblock(capsys):
     '''Tests that a module that cannot be parsed and becomes a codeblock
     is handled correctly.
     '''
-    dyn_test_dir = get_base_path("lfric")
     mod_man = ModuleManager.get()
-    mod_man.add_search_path(os.path.join(dyn_test_dir, "driver_creation"))
+    mod_man.add_search_path(DRIVER_CREATION_DIR)
 
     cblock = CodeBlock([], "dummy")
     mod_info = mod_man.get_module_info("testkern_import_symbols_mod")